@@ -1,26 +1,28 @@
-from dataclasses import dataclass
-from typing import Sequence
+from dataclasses import dataclass, field
 
 from stabbie.fstab.entry.mount_point import MountPoint
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class FstabEntry:
     name: str
     mount_point: MountPoint
     fs_type: str
-    mount_options: Sequence[str]
+    mount_options: tuple[str, ...]
     dump_frequency: int = 0
     fsck_pass_number: int = 0
+    __mount_options_set: frozenset[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.__mount_options_set = frozenset(self.mount_options)
+
+    def has_mount_option(self, option: str) -> bool:
+        """Check if the entry has a mount option"""
+        return option in self.__mount_options_set
 
     def __str__(self) -> str:
-        return " ".join(
-            (
-                self.name,
-                str(self.mount_point),
-                self.fs_type,
-                ",".join(self.mount_options),
-                str(self.dump_frequency),
-                str(self.fsck_pass_number),
-            )
+        return (
+            f"{self.name} {self.mount_point.path} {self.fs_type} "
+            f"{','.join(self.mount_options)} {self.dump_frequency} "
+            f"{self.fsck_pass_number}"
         )
@@ -0,0 +1,102 @@
+import ctypes
+import os
+from functools import cache
+
+
+class LibMountError(Exception):
+    """Error raised when a libmount operation fails"""
+
+
+class LibMount:
+    """
+    Minimal ctypes binding to util-linux's libmount.
+
+    Mounting through libmount avoids spawning a mount or umount process per
+    mount point, while still resolving the target from fstab and calling the
+    filesystem's mount helper (eg. mount.nfs) like the commands do.
+    """
+
+    library_name = "libmount.so.1"
+    message_size = 1024
+
+    __library: ctypes.CDLL
+
+    def __init__(self, library_path: str) -> None:
+        library = ctypes.CDLL(library_path, use_errno=True)
+        library.mnt_new_context.restype = ctypes.c_void_p
+        library.mnt_new_context.argtypes = []
+        library.mnt_free_context.restype = None
+        library.mnt_free_context.argtypes = [ctypes.c_void_p]
+        library.mnt_context_set_target.restype = ctypes.c_int
+        library.mnt_context_set_target.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        for name in ("mnt_context_enable_force", "mnt_context_enable_lazy"):
+            function = getattr(library, name)
+            function.restype = ctypes.c_int
+            function.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        for name in ("mnt_context_mount", "mnt_context_umount"):
+            function = getattr(library, name)
+            function.restype = ctypes.c_int
+            function.argtypes = [ctypes.c_void_p]
+        library.mnt_context_get_excode.restype = ctypes.c_int
+        library.mnt_context_get_excode.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_size_t,
+        ]
+        self.__library = library
+
+    @classmethod
+    @cache
+    def get(cls) -> "LibMount | None":
+        """
+        Get the shared libmount binding, or None if libmount is unavailable.
+
+        The library is loaded by its soname, since looking it up with
+        ctypes.util.find_library spawns processes.
+        Not locked, call it once before using it from multiple threads.
+        """
+        try:
+            return cls(cls.library_name)
+        except (OSError, AttributeError):
+            return None
+
+    def __run(
+        self, target: str, unmount: bool, force: bool = False, lazy: bool = False
+    ) -> None:
+        # A context per operation, since refreshes run in multiple threads
+        context = self.__library.mnt_new_context()
+        if context is None:
+            raise LibMountError("Couldn't create a libmount context")
+        try:
+            self.__library.mnt_context_set_target(context, os.fsencode(target))
+            if force:
+                self.__library.mnt_context_enable_force(context, 1)
+            if lazy:
+                self.__library.mnt_context_enable_lazy(context, 1)
+            if unmount:
+                status = self.__library.mnt_context_umount(context)
+            else:
+                status = self.__library.mnt_context_mount(context)
+            # The status is 0 when a helper (eg. mount.nfs) ran but failed,
+            # the exit code accounts for the helper status like mount does
+            message = ctypes.create_string_buffer(self.message_size)
+            exit_code = self.__library.mnt_context_get_excode(
+                context, status, message, self.message_size
+            )
+        finally:
+            self.__library.mnt_free_context(context)
+        if exit_code != 0:
+            # Helpers print their own errors, leaving the message empty
+            reason = message.value.decode(errors="replace")
+            if len(reason) == 0:
+                reason = f"exit code {exit_code}"
+            raise LibMountError(f"libmount failed on {target}: {reason}")
+
+    def mount(self, target: str) -> None:
+        """Mount a target, using its fstab entry"""
+        self.__run(target, unmount=False)
+
+    def unmount(self, target: str, force: bool, lazy: bool) -> None:
+        """Unmount a target"""
+        self.__run(target, unmount=True, force=force, lazy=lazy)
@@ -1,8 +1,13 @@
+import os
+import re
 import subprocess
-from pathlib import Path
+import threading
+from os.path import ismount
 from subprocess import SubprocessError
 from typing import Sequence
 
+from stabbie.fstab.entry.libmount import LibMount, LibMountError
+
 
 class MountError(Exception):
     """Error raised when a mount point couldn't be mounted"""
@@ -13,45 +18,143 @@ class UnmountError(Exception):
 
 
 class MountPoint:
+    __slots__ = ("path", "mount_command", "unmount_command")
+
     path: str
+    mount_command: Sequence[str]
+    unmount_command: Sequence[str]
     unmount_force: bool = True
     unmount_lazy: bool = True
 
+    # Characters octal-escaped in fstab and mountinfo paths
+    escaped_characters: str = " \t\n\\"
+    escape_pattern: re.Pattern[str] = re.compile(r"\\([0-7]{3})")
+
     def __init__(self, path: str) -> None:
         self.path = path
+        # Built once, the path never changes
+        self.mount_command = ("mount", path)
+        self.unmount_command = self.get_unmount_command((path,))
 
     def __str__(self) -> str:
         return self.path
 
-    @property
-    def mount_command(self) -> Sequence[str]:
-        return ["mount", self.path]
+    @classmethod
+    def get_unmount_command(cls, paths: Sequence[str]) -> Sequence[str]:
+        options = ("-f",) if cls.unmount_force else ()
+        if cls.unmount_lazy:
+            options += ("-l",)
+        return ("umount", *options, *paths)
 
-    @property
-    def unmount_command(self) -> Sequence[str]:
-        command = ["umount"]
-        if self.unmount_force:
-            command.append("-f")
-        if self.unmount_lazy:
-            command.append("-l")
-        command.append(self.path)
-        return command
+    # Mounted paths cache, shared by the refresh threads
+    # The generation changes when the cache is cleared, so that a read started
+    # before a mount or unmount doesn't fill the cache with stale paths
+    __mounted_paths_lock = threading.Lock()
+    __mounted_paths: frozenset[str] | None = None
+    __mounted_paths_cached: bool = False
+    __mounted_paths_generation: int = 0
 
-    def check_is_mounted(self) -> bool:
-        """Check if the mount point is already mounted"""
+    @classmethod
+    def get_mounted_paths(cls) -> frozenset[str] | None:
+        """
+        Get the paths of the system's mount points, or None if unavailable.
+
+        Read once from /proc/self/mountinfo instead of stat-ing every mount point.
+        Paths are kept octal-escaped, as in fstab.
+        Cached, cleared with clear_mounted_paths after mounting or unmounting.
+        """
+        with cls.__mounted_paths_lock:
+            if cls.__mounted_paths_cached:
+                return cls.__mounted_paths
+            generation = cls.__mounted_paths_generation
         try:
-            return Path(self.path).is_mount()
+            with open("/proc/self/mountinfo", "r", encoding="utf-8") as file:
+                mounted_paths = frozenset(line.split()[4] for line in file)
         except OSError:
-            return False
+            mounted_paths = None
+        with cls.__mounted_paths_lock:
+            if generation == cls.__mounted_paths_generation:
+                cls.__mounted_paths = mounted_paths
+                cls.__mounted_paths_cached = True
+        return mounted_paths
+
+    @classmethod
+    def clear_mounted_paths(cls) -> None:
+        """Clear the mounted paths cache, after mounting or unmounting"""
+        with cls.__mounted_paths_lock:
+            cls.__mounted_paths_generation += 1
+            cls.__mounted_paths_cached = False
+
+    @classmethod
+    def get_canonical_path(cls, path: str) -> str:
+        """
+        Get an octal-escaped path with its symlinks resolved, as in mountinfo.
+        Eg. /mnt/share is /var/mnt/share when /mnt links to /var/mnt.
+        """
+        unescaped = cls.escape_pattern.sub(lambda match: chr(int(match[1], 8)), path)
+        return "".join(
+            (
+                f"\\{ord(character):03o}"
+                if character in cls.escaped_characters
+                else character
+            )
+            for character in os.path.realpath(unescaped)
+        )
+
+    def check_is_mounted(self) -> bool:
+        """Check if the mount point is already mounted"""
+        mounted_paths = self.get_mounted_paths()
+        if mounted_paths is not None:
+            return self.get_canonical_path(self.path) in mounted_paths
+        # Without mountinfo (eg. in some containers), compare with the parent
+        return ismount(self.path)
 
     def mount(self):
+        """Mount using libmount if available, else the mount command"""
+        libmount = LibMount.get()
         try:
-            subprocess.run(self.mount_command, check=True)
-        except SubprocessError as error:
+            if libmount is None:
+                subprocess.run(self.mount_command, check=True)
+            else:
+                libmount.mount(self.path)
+        except (SubprocessError, LibMountError) as error:
             raise MountError() from error
+        finally:
+            self.clear_mounted_paths()
 
     def unmount(self):
+        """Unmount using libmount if available, else the umount command"""
+        libmount = LibMount.get()
+        try:
+            if libmount is None:
+                subprocess.run(self.unmount_command, check=True)
+            else:
+                libmount.unmount(self.path, self.unmount_force, self.unmount_lazy)
+        except (SubprocessError, LibMountError) as error:
+            raise UnmountError() from error
+        finally:
+            self.clear_mounted_paths()
+
+    @classmethod
+    def unmount_all(cls, mount_points: Sequence["MountPoint"]) -> None:
+        """
+        Unmount multiple mount points, in process with libmount if available,
+        else with a single umount process.
+        Stops at the first failure.
+        """
+        libmount = LibMount.get()
         try:
-            subprocess.run(self.unmount_command, check=True)
-        except SubprocessError as error:
+            if libmount is None:
+                command = cls.get_unmount_command(
+                    [mount_point.path for mount_point in mount_points]
+                )
+                subprocess.run(command, check=True)
+            else:
+                for mount_point in mount_points:
+                    libmount.unmount(
+                        mount_point.path, cls.unmount_force, cls.unmount_lazy
+                    )
+        except (SubprocessError, LibMountError) as error:
             raise UnmountError() from error
+        finally:
+            cls.clear_mounted_paths()
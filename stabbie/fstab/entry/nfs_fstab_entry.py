@@ -1,29 +1,34 @@
 from dataclasses import dataclass, field
 import logging
 
+from stabbie.fstab.entry.nfs_service import NfsService
 from stabbie.fstab.entry.remote_fstab_entry import RemoteFstabEntry
-from stabbie.fstab.entry.service import Service
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class NfsFstabEntry(RemoteFstabEntry):
     remote_path: str = field(init=False)
 
     def __post_init__(self) -> None:
         """Generate the values specific to NFS entries from its values"""
 
+        # Explicit super, slotted dataclasses break the implicit form
+        super(NfsFstabEntry, self).__post_init__()
+
         # Get host and remote path
         # Split once from the right to allow raw IPv6 hosts
-        host, remote_path = self.name.rsplit(":", maxsplit=1)
+        host, separator, remote_path = self.name.rpartition(":")
+        if len(separator) == 0:
+            raise ValueError(f"Invalid NFS device, expected host:path: {self.name}")
 
         # Get the NFS specific mount options
         options = NfsMountOptions.from_entry(self)
 
-        self.service = Service.new_cached(host, options.port)
+        self.service = NfsService.new_cached(host, options.port, options.version)
         self.remote_path = remote_path
 
 
-@dataclass
+@dataclass(slots=True)
 class NfsMountOptions:
     version: int
     port: int
@@ -32,19 +37,16 @@ class NfsMountOptions:
     def from_entry(cls, entry: NfsFstabEntry) -> "NfsMountOptions":
         """Create nfs mount options from a raw options string"""
 
-        # Get the options that are in key=value format
-        options_mapping = {}
+        # Only look for the NFS specific options that are used
+        version = NfsService.default_version
+        port: int | None = None
         for option in entry.mount_options:
-            try:
-                key, value = option.split("=", maxsplit=1)
-            except ValueError:
-                continue
-            options_mapping[key] = value
-
-        # Get nfs specific options
-        version = int(options_mapping.get("version", 3))
-        default_port = 2049 if version == 4 else 0
-        port = int(options_mapping.get("port", default_port))
+            if option.startswith("version="):
+                version = int(option[len("version=") :])
+            elif option.startswith("port="):
+                port = int(option[len("port=") :])
+        if port is None:
+            port = 2049 if version == 4 else 0
         if port == 0:
             logging.warning(
                 "RPC discovery of NFS port is not implemented."
@@ -0,0 +1,86 @@
+import random
+import socket
+import struct
+import time
+from functools import cache
+
+from stabbie.fstab.entry.service import Service
+
+
+class NfsService(Service):
+    """
+    NFS service, checked with an RPC NULL call to make sure that the peer is
+    really an NFS server and not any TCP listener.
+    """
+
+    __slots__ = ("version",)
+
+    RPC_CALL = 0
+    RPC_REPLY = 1
+    RPC_VERSION = 2
+    NFS_PROGRAM = 100003
+    NULL_PROCEDURE = 0
+    AUTH_NULL = 0
+    LAST_FRAGMENT = 0x80000000
+
+    default_version: int = 3
+
+    version: int
+
+    def __init__(self, host: str, port: int, version: int = default_version) -> None:
+        self.version = version
+        super().__init__(host, port)
+
+    def _get_id(self) -> tuple:
+        return (*super()._get_id(), self.version)
+
+    @classmethod
+    def new_cached(
+        cls, host: str, port: int, version: int = default_version
+    ) -> "NfsService":
+        """
+        Get a shared service, compatible with Service.new_cached.
+        The version is passed explicitly so that it is always part of the key.
+        """
+        return cls.__new_cached(host, port, version)
+
+    @classmethod
+    @cache
+    def __new_cached(cls, host: str, port: int, version: int) -> "NfsService":
+        return cls(host, port, version)
+
+    def _check_connection(self, connection: socket.socket, deadline: float) -> bool:
+        xid = random.getrandbits(32)
+        call = struct.pack(
+            ">10I",
+            xid,
+            self.RPC_CALL,
+            self.RPC_VERSION,
+            self.NFS_PROGRAM,
+            self.version,
+            self.NULL_PROCEDURE,
+            self.AUTH_NULL,  # Credentials flavor and length
+            0,
+            self.AUTH_NULL,  # Verifier flavor and length
+            0,
+        )
+        record_mark = struct.pack(">I", self.LAST_FRAGMENT | len(call))
+
+        # Any reply to our call is enough, even a version mismatch
+        reply = b""
+        try:
+            connection.setblocking(True)
+            connection.sendall(record_mark + call)
+            while len(reply) < 12:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                connection.settimeout(remaining)
+                chunk = connection.recv(12 - len(reply))
+                if len(chunk) == 0:
+                    return False
+                reply += chunk
+        except OSError:
+            return False
+        _record_mark, reply_xid, message_type = struct.unpack(">3I", reply)
+        return reply_xid == xid and message_type == self.RPC_REPLY
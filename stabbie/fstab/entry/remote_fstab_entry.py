@@ -1,11 +1,13 @@
 from dataclasses import dataclass, field
 import logging
+from typing import Sequence
 
 from stabbie.fstab.entry.fstab_entry import FstabEntry
+from stabbie.fstab.entry.mount_point import MountError, MountPoint, UnmountError
 from stabbie.fstab.entry.service import Service
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class RemoteFstabEntry(FstabEntry):
     """
     Abstract class representing an fstab entry pointing to a remote filesystem.
@@ -18,28 +20,77 @@ class RemoteFstabEntry(FstabEntry):
         """
         Mount the mount point if the server is connectable, else unmount them.
         If the mounted state is already achieved, doesn't change it.
+        Raises the MountError or UnmountError of the mount point.
         """
+        errors = self.__refresh([self])
+        if len(errors) > 0:
+            raise errors[0]
 
-        service_ok = self.service.check_is_connectable()
-        logging.info("Service %s: %s", self.service, "OK" if service_ok else "AWAY")
-        mounted = self.mount_point.check_is_mounted()
-
-        # Easy cases, nothing to do
-        if service_ok and mounted:
-            logging.info("%s skipped, already mounted", self.mount_point.path)
-            return
-        if not service_ok and not mounted:
-            logging.info("%s skipped, already unmounted", self.mount_point.path)
-            return
-
-        # Needs to be mounted
-        if service_ok and not mounted:
-            self.mount_point.mount()
-            logging.info("%s mounted", self.mount_point.path)
-            return
-
-        # Needs to be unmounted
-        if not service_ok and mounted:
-            self.mount_point.unmount()
-            logging.info("%s unmounted", self.mount_point.path)
-            return
+    @classmethod
+    def refresh_mount_points(cls, entries: Sequence["RemoteFstabEntry"]) -> None:
+        """
+        Refresh the mount points of multiple entries.
+
+        Mount points are mounted one by one, since mount only accepts a single
+        target, but those to unmount are unmounted with a single umount call.
+        Errors are raised together in an ExceptionGroup once every entry has
+        been handled.
+        """
+        errors = cls.__refresh(entries)
+        if len(errors) > 0:
+            raise ExceptionGroup("Some mount points couldn't be refreshed", errors)
+
+    @classmethod
+    def __refresh(cls, entries: Sequence["RemoteFstabEntry"]) -> list[Exception]:
+        """Refresh the mount points of multiple entries, returns the errors"""
+
+        errors: list[Exception] = []
+        to_unmount: list[MountPoint] = []
+
+        for entry in entries:
+            service_ok = entry.service.check_is_connectable()
+            logging.info(
+                "Service %s: %s", entry.service, "OK" if service_ok else "AWAY"
+            )
+            mount_point = entry.mount_point
+            mounted = mount_point.check_is_mounted()
+
+            # Easy cases, nothing to do
+            if service_ok and mounted:
+                logging.info("%s skipped, already mounted", mount_point.path)
+                continue
+            if not service_ok and not mounted:
+                logging.info("%s skipped, already unmounted", mount_point.path)
+                continue
+
+            # Needs to be mounted
+            if service_ok and not mounted:
+                try:
+                    mount_point.mount()
+                except MountError as error:
+                    errors.append(error)
+                    continue
+                logging.info("%s mounted", mount_point.path)
+                continue
+
+            # Needs to be unmounted
+            to_unmount.append(mount_point)
+
+        # Unmount in batch, retry one by one to isolate the failing mount points
+        if len(to_unmount) > 0:
+            try:
+                MountPoint.unmount_all(to_unmount)
+            except UnmountError:
+                for mount_point in to_unmount:
+                    if mount_point.check_is_mounted():
+                        try:
+                            mount_point.unmount()
+                        except UnmountError as error:
+                            errors.append(error)
+                            continue
+                    logging.info("%s unmounted", mount_point.path)
+            else:
+                for mount_point in to_unmount:
+                    logging.info("%s unmounted", mount_point.path)
+
+        return errors
@@ -1,43 +1,135 @@
+import errno
+import selectors
 import socket
-from functools import cache, lru_cache
+import time
+from functools import cache
 
 
 class Service:
+    __slots__ = ("host", "port", "__id", "__key", "__hash", "__connectable")
+
     host: str
     port: int
 
     check_timeout_seconds: int = 3
 
+    __id: tuple
+    __key: str
+    __hash: int
+    __connectable: bool | None
+
     def __init__(self, host: str, port: int) -> None:
         self.host = host
         self.port = port
+        # Computed once, services are hashed and compared a lot
+        self.__id = self._get_id()
+        self.__key = f"{host}:{port}"
+        self.__hash = hash(self.__id)
+        self.__connectable = None
+
+    def _get_id(self) -> tuple:
+        """
+        Get the values identifying the service.
+        Child classes with more parameters must extend it, set them first.
+        """
+        return (self.host, self.port)
 
     @classmethod
     @cache
-    def new_cached(cls, *args, **kwargs) -> "Service":
-        return Service(*args, **kwargs)
+    def new_cached(cls, host: str, port: int) -> "Service":
+        """Get a shared service, pass arguments positionally for a cheaper key"""
+        return cls(host, port)
 
     def __str__(self) -> str:
-        return f"{self.host}:{self.port}"
+        return self.__key
 
-    def __eq__(self, other: "Service") -> bool:
-        return str(self) == str(other)
+    def __eq__(self, other: object) -> bool:
+        # Services of different classes are probed differently
+        return type(self) is type(other) and self.__id == other.__id
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return self.__hash
+
+    @staticmethod
+    @cache
+    def resolve(host: str) -> tuple:
+        """
+        Get the stream socket addresses of a host, without port.
+        Cached so that services on the same host share a single name lookup,
+        whatever their class. Concurrent calls for a host aren't merged,
+        resolve the hosts before probing their services concurrently.
+        """
+        try:
+            return tuple(socket.getaddrinfo(host, None, type=socket.SOCK_STREAM))
+        except OSError:
+            return ()
+
+    def _connect(self, deadline: float) -> socket.socket | None:
+        """
+        Open a connection to the service, or None if it couldn't be reached.
+
+        All the addresses of the host are connected to at once with non-blocking
+        connects, and the first one to succeed is used. This bounds the wait
+        by the deadline instead of a timeout per address.
+        """
+        addresses = self.resolve(self.host)
+        pending: list[socket.socket] = []
+        with selectors.DefaultSelector() as selector:
+            try:
+                for family, kind, proto, _canonical_name, host_address in addresses:
+                    address = (host_address[0], self.port, *host_address[2:])
+                    try:
+                        connection = socket.socket(family, kind, proto)
+                    except OSError:
+                        # Eg. address family disabled on this system
+                        continue
+                    pending.append(connection)
+                    connection.setblocking(False)
+                    if connection.connect_ex(address) in (0, errno.EINPROGRESS):
+                        selector.register(connection, selectors.EVENT_WRITE)
+                while len(selector.get_map()) > 0:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    for key, _events in selector.select(remaining):
+                        connection = key.fileobj
+                        selector.unregister(connection)
+                        error = connection.getsockopt(
+                            socket.SOL_SOCKET, socket.SO_ERROR
+                        )
+                        if error == 0:
+                            pending.remove(connection)
+                            return connection
+            finally:
+                for connection in pending:
+                    connection.close()
+        return None
+
+    def _check_connection(self, connection: socket.socket, deadline: float) -> bool:
+        """
+        Check that the connected peer is the expected service.
+        Child classes may override this to speak their protocol.
+        """
+        return True
+
+    def _probe(self) -> bool:
+        """Probe the service over the network"""
+        deadline = time.monotonic() + self.check_timeout_seconds
+        connection = self._connect(deadline)
+        if connection is None:
+            return False
+        with connection:
+            return self._check_connection(connection, deadline)
 
-    @lru_cache(maxsize=1)
     def check_is_connectable(self) -> bool:
         """
         Check if the service is connectable.
 
-        Cached because the program is short lived and a service is assumed to
-        not change state during a run.
+        Cached on the instance because the program is short lived and a service
+        is assumed to not change state during a run.
+        Unlike a functools cache on the method, this doesn't keep services alive
+        nor evict the result of other services.
         """
-        try:
-            with socket.create_connection(
-                (self.host, self.port), self.check_timeout_seconds, all_errors=True
-            ) as _server_socket:
-                return True
-        except ExceptionGroup:
-            return False
+        if self.__connectable is None:
+            self.__connectable = self._probe()
+        return self.__connectable
@@ -2,40 +2,61 @@ import logging
 
 from stabbie.fstab.entry.fstab_entry import FstabEntry
 from stabbie.fstab.entry.fstab_entry_builder import FstabEntryBuilder
+from stabbie.fstab.entry.remote_fstab_entry import RemoteFstabEntry
 
 
 class Fstab:
     entries: list[FstabEntry]
+    remote_entries: list[RemoteFstabEntry]
 
-    def __init__(self, entries: list[FstabEntry]) -> None:
+    def __init__(
+        self, entries: list[FstabEntry], remote_entries: list[RemoteFstabEntry]
+    ) -> None:
         self.entries = entries
+        self.remote_entries = remote_entries
 
     def __str__(self) -> str:
-        return "\n".join(self.entries)
+        return "\n".join(str(entry) for entry in self.entries)
 
     def __iter__(self):
         yield from self.entries
 
 
 class FstabBuilder:
-    def cleanup_line(self, line: str) -> str:
-        # Remove comment
-        line = line.split("#")[0]
+    def cleanup_line(self, line: bytes) -> bytes:
+        # Remove comment, without splitting the whole line
+        comment_start = line.find(b"#")
+        if comment_start >= 0:
+            line = line[:comment_start]
         # Remove leading and trailing whitespace
         return line.strip()
 
-    def from_file(self, fstab_path: str = "/etc/fstab") -> Fstab:
-        """Create a fstab object from the local fstab file"""
+    def from_file(
+        self, fstab_path: str = "/etc/fstab", remote_only: bool = False
+    ) -> Fstab:
+        """
+        Create a fstab object from the local fstab file.
+        If remote_only is set, other entries are skipped before being parsed.
+        """
         entry_builder = FstabEntryBuilder()
         entries: list[FstabEntry] = []
-        with open(fstab_path, "r", encoding="utf-8") as file:
-            for i, line in enumerate(file):
-                cleaned_line = self.cleanup_line(line)
-                if len(cleaned_line) == 0:
-                    continue
-                entry = entry_builder.from_line(cleaned_line)
-                logging.debug("[%s:%d] Parsed fstab entry: %s", fstab_path, i, entry)
-                entries.append(entry)
-        fstab = Fstab(entries)
+        remote_entries: list[RemoteFstabEntry] = []
+        # The file is small, read it at once
+        # Blank and comment lines are skipped before being decoded
+        with open(fstab_path, "rb") as file:
+            raw_lines = file.read().splitlines()
+        for i, raw_line in enumerate(raw_lines):
+            cleaned_raw_line = self.cleanup_line(raw_line)
+            if len(cleaned_raw_line) == 0:
+                continue
+            cleaned_line = cleaned_raw_line.decode("utf-8")
+            if remote_only and not entry_builder.check_is_remote(cleaned_line):
+                continue
+            entry = entry_builder.from_line(cleaned_line)
+            logging.debug("[%s:%d] Parsed fstab entry: %s", fstab_path, i, entry)
+            entries.append(entry)
+            if isinstance(entry, RemoteFstabEntry):
+                remote_entries.append(entry)
+        fstab = Fstab(entries, remote_entries)
         logging.debug("Loaded fstab from %s with %d entries", fstab_path, len(entries))
         return fstab
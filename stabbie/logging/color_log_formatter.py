@@ -11,16 +11,17 @@ class ColorLogFormatter(Formatter):
     RED = "\033[31m"
     YELLOW = "\033[33m"
 
+    # Color prefix per level, levels without an entry are not colored
+    PREFIXES = {
+        logging.CRITICAL: BOLD + RED,
+        logging.ERROR: RED,
+        logging.WARNING: YELLOW,
+        logging.DEBUG: DIM,
+    }
+
     def format(self, record: LogRecord) -> str:
         super_format = super().format(record)
-        match record.levelno:
-            case logging.CRITICAL:
-                return self.BOLD + self.RED + super_format + self.RESET
-            case logging.ERROR:
-                return self.RED + super_format + self.RESET
-            case logging.WARNING:
-                return self.YELLOW + super_format + self.RESET
-            case logging.DEBUG:
-                return self.DIM + super_format + self.RESET
-            case _:
-                return super_format
+        prefix = self.PREFIXES.get(record.levelno)
+        if prefix is None:
+            return super_format
+        return f"{prefix}{super_format}{self.RESET}"
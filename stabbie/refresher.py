@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from stabbie.fstab.entry.remote_fstab_entry import RemoteFstabEntry
+from stabbie.fstab.entry.service import Service
+
+
+class Refresher:
+    """Class refreshing remote fstab entries concurrently, in an event loop"""
+
+    refresh_concurrency: int = 8
+
+    async def check_services(self, services: set[Service]) -> None:
+        """
+        Check the connectivity of services concurrently.
+        Failed checks are left for the refresh to retry and report.
+        """
+
+        # Resolve each host once, before its services are probed concurrently
+        hosts = {service.host for service in services}
+        await asyncio.gather(
+            *(asyncio.to_thread(Service.resolve, host) for host in hosts),
+            return_exceptions=True,
+        )
+        await asyncio.gather(
+            *(asyncio.to_thread(service.check_is_connectable) for service in services),
+            return_exceptions=True,
+        )
+
+    async def __refresh_group(
+        self, semaphore: asyncio.Semaphore, entries: list[RemoteFstabEntry]
+    ) -> None:
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                await asyncio.to_thread(RemoteFstabEntry.refresh_mount_points, entries)
+            finally:
+                # Logged from the event loop, once the worker thread is done
+                logging.debug(
+                    "Refreshed %d entries of %s in %.2fs",
+                    len(entries),
+                    entries[0].service,
+                    time.monotonic() - start,
+                )
+
+    async def refresh_groups(
+        self, groups: Iterable[list[RemoteFstabEntry]]
+    ) -> list[Exception]:
+        """
+        Refresh groups of remote entries concurrently.
+        Entries of a group are refreshed in order, in a worker thread.
+        Returns the errors raised by the groups.
+        """
+        semaphore = asyncio.Semaphore(self.refresh_concurrency)
+        results = await asyncio.gather(
+            *(self.__refresh_group(semaphore, entries) for entries in groups),
+            return_exceptions=True,
+        )
+        return [result for result in results if isinstance(result, Exception)]
+
+    async def refresh_entries(self, entries: list[RemoteFstabEntry]) -> list[Exception]:
+        """
+        Check the services of remote entries, then refresh their mount points.
+        Returns the refresh errors.
+        """
+
+        # Size the worker threads for I/O, not for the CPU count
+        # There is one check and one refresh group per service
+        services = {entry.service for entry in entries}
+        max_workers = min(32, max(4, len(services)))
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=max_workers)
+        )
+
+        # Check the services of the remote entries concurrently
+        # - Services with the same host and port are reused
+        # - Connection checks are cached per service
+        logging.info("Checking remote services")
+        await self.check_services(services)
+
+        # Refresh mount points for the remote entries of the fstab file
+        # - Entries are grouped per service to batch their unmounting
+        # - Groups are refreshed concurrently, sharing the checked services
+        groups: dict[Service, list[RemoteFstabEntry]] = defaultdict(list)
+        for entry in entries:
+            groups[entry.service].append(entry)
+        return await self.refresh_groups(groups.values())
+
+    def run(self, entries: list[RemoteFstabEntry]) -> list[Exception]:
+        """Refresh remote entries in a new event loop, returns the refresh errors"""
+        return asyncio.run(self.refresh_entries(entries))
@@ -4,12 +4,6 @@ from argparse import ArgumentParser
 import logging
 import os
 import sys
-from logging.config import dictConfig as logging_dict_config
-from multiprocessing import Pool
-
-from stabbie.fstab.entry.fstab_entry import FstabEntry
-from stabbie.fstab.entry.remote_fstab_entry import RemoteFstabEntry
-from stabbie.fstab.fstab import FstabBuilder
 
 
 class Application:
@@ -18,8 +12,7 @@ class Application:
     stabbie_mount_option = "x-stabbie"
     use_color_logs: bool = True
     log_level: str = "INFO"
-
-    __refresh_errors: list[Exception]
+    log_levels: tuple[str, ...] = tuple(logging.getLevelNamesMapping())
 
     def __parse_cli_args(self) -> None:
         """Parse cli args with argparse to configure the app"""
@@ -33,88 +26,78 @@ class Application:
             type=str,
             default=Application.log_level,
             help="logging level to use",
-            choices=logging.getLevelNamesMapping().keys(),
+            choices=Application.log_levels,
         )
         args = parser.parse_args()
         self.use_color_logs = args.color
         self.log_level = args.log_level
 
     def __init__(self) -> None:
-        self.__refresh_errors = []
         self.__parse_cli_args()
 
-    def __check_mount_permissions(self) -> None:
-        assert os.geteuid() == 0, "Insufficient privileges to mount and unmout"
-
     def __setup_logging(self) -> None:
         """Setup logging for the app"""
 
-        # Configure logging
-        logging_dict_config(
-            {
-                "version": 1,
-                "formatters": {
-                    "color_formatter": {
-                        "format": "[{levelname}] {message}",
-                        "style": "{",
-                        "class": (
-                            "stabbie.logging.color_log_formatter.ColorLogFormatter"
-                            if self.use_color_logs
-                            else "logging.Formatter"
-                        ),
-                    }
-                },
-                "handlers": {
-                    "console_handler": {
-                        "class": "logging.StreamHandler",
-                        "level": self.log_level,
-                        "formatter": "color_formatter",
-                    }
-                },
-                "root": {
-                    "level": logging.NOTSET,
-                    "handlers": ["console_handler"],
-                },
-            }
-        )
+        # Configure logging directly, without the dictConfig machinery
+        formatter_class = logging.Formatter
+        if self.use_color_logs:
+            from stabbie.logging.color_log_formatter import ColorLogFormatter
 
-    def fstab_entries_filter_key(self, entry: FstabEntry):
-        """Consider only remote entries with a custom mount option"""
-        return (
-            isinstance(entry, RemoteFstabEntry)
-            and self.stabbie_mount_option in entry.mount_options
+            formatter_class = ColorLogFormatter
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(self.log_level)
+        console_handler.setFormatter(
+            formatter_class("[{levelname}] {message}", style="{")
+        )
+        # The root level is set too, so that isEnabledFor can skip work
+        logging.basicConfig(
+            level=self.log_level, handlers=[console_handler], force=True
         )
-
-    @classmethod
-    def refresh_remote_fstab_entry(cls, entry: RemoteFstabEntry) -> None:
-        logging.info("Refreshing %s", entry.name)
-        entry.refresh_mount_point()
-
-    def refresh_error_callback(self, error: Exception) -> None:
-        self.__refresh_errors.append(error)
 
     def run(self):
-        self.__check_mount_permissions()
         self.__setup_logging()
 
         # Load fstab
+        # The fstab and refresh modules are imported after the permissions check,
+        # they are the bulk of the startup time
         logging.info("Reading fstab")
-        fstab = FstabBuilder().from_file()
-
-        # Refresh mount points for the remote entries of the fstab file
-        # - Services with the same host and port are reused
-        # - Connection checks are cached per service
-        logging.info("Refreshing remote filesystem mount points")
-        with Pool() as pool:
-            pool.map_async(
-                Application.refresh_remote_fstab_entry,
-                filter(self.fstab_entries_filter_key, fstab),
+        from stabbie.fstab.entry.libmount import LibMount
+        from stabbie.fstab.entry.remote_fstab_entry import RemoteFstabEntry
+        from stabbie.fstab.fstab import FstabBuilder
+
+        fstab = FstabBuilder().from_file(remote_only=True)
+
+        # Consider only remote entries with a custom mount option
+        option = self.stabbie_mount_option
+        entries = [
+            entry for entry in fstab.remote_entries if entry.has_mount_option(option)
+        ]
+
+        # The names are only joined when they will be logged
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(
+                "Refreshing %d remote mount points: %s",
+                len(entries),
+                ", ".join(entry.name for entry in entries),
             )
-            pool.close()
-            pool.join()
+
+        # Load libmount once, before the worker threads need it
+        LibMount.get()
+
+        # Refresh the remote entries concurrently in an event loop
+        # Entries of a single service are a single group, refreshed inline
+        errors: list[Exception] = []
+        if len({entry.service for entry in entries}) > 1:
+            from stabbie.refresher import Refresher
+
+            errors = Refresher().run(entries)
+        elif len(entries) > 0:
+            try:
+                RemoteFstabEntry.refresh_mount_points(entries)
+            except Exception as error:
+                errors.append(error)
 
         # Errors summary
-        errors = self.__refresh_errors
         if len(errors) > 0:
             logging.warning(
                 "Some mount points couldn't be refreshed",
@@ -126,6 +109,10 @@ class Application:
 
 def main():
     app = Application()
+    # Checked before any work, but after the arguments to allow --help
+    if os.geteuid() != 0:
+        sys.stderr.write("Insufficient privileges to mount and unmount\n")
+        sys.exit(1)
     app.run()
     sys.exit(0)
 
@@ -0,0 +1,65 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from stabbie.fstab.entry.libmount import LibMount
+
+
+@unittest.skipIf(LibMount.get() is None, "libmount is unavailable")
+@unittest.skipIf(os.geteuid() != 0, "mounting requires root")
+@unittest.skipIf(shutil.which("unshare") is None, "unshare is unavailable")
+class TestLibMountHelperFailure(unittest.TestCase):
+    """
+    Mount with a failing mount helper, in a private mount namespace.
+    libmount returns 0 when a helper ran, even if the helper failed.
+    """
+
+    def test_failing_helper_raises(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            helpers = root / "sbin"
+            helpers.mkdir()
+            helper = helpers / "mount.fakefs"
+            helper.write_text("#!/bin/sh\nexit 32\n")
+            helper.chmod(0o755)
+            target = root / "target"
+            target.mkdir()
+            fstab = root / "fstab"
+            fstab.write_text(f"none {target} fakefs defaults 0 0\n")
+
+            # Helpers are looked up in /sbin, shadow it in the namespace only
+            sbin = os.path.realpath("/sbin")
+            script = textwrap.dedent(f"""
+                from stabbie.fstab.entry.libmount import LibMount, LibMountError
+                try:
+                    LibMount.get().mount({str(target)!r})
+                except LibMountError:
+                    raise SystemExit(0)
+                raise SystemExit(1)
+                """)
+            result = subprocess.run(
+                (
+                    "unshare",
+                    "--mount",
+                    "--propagation",
+                    "private",
+                    "sh",
+                    "-c",
+                    f'mount --bind "$0" {sbin} && exec "$1" -c "$2"',
+                    str(helpers),
+                    sys.executable,
+                    script,
+                ),
+                env={**os.environ, "LIBMOUNT_FSTAB": str(fstab)},
+                check=False,
+            )
+            self.assertEqual(result.returncode, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()